@@ -1,10 +1,11 @@
 from starlette.endpoints import HTTPEndpoint
 
+from app import settings
 from app.globals import templates
 
 
 class Home(HTTPEndpoint):
     async def get(self, request):
         template = "home.html"
-        context = {"request": request}
+        context = {"request": request, "admin_enabled": settings.ADMIN_ENABLED}
         return templates.TemplateResponse(template, context)
@@ -7,29 +7,46 @@ from starlette.middleware.authentication import AuthenticationMiddleware
 from starlette.middleware.cors import CORSMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 from starlette.routing import Mount, Route
-from starlette.staticfiles import StaticFiles
 
-from app import admin, db, endpoints, globals, handlers, settings
+from app import db, endpoints, globals, handlers, settings
+from app.middleware import SkipForRoute
+from app.staticfiles import StaticFiles
 
 starlette_admin.config.templates = globals.templates
 starlette_auth.config.templates = globals.templates
 
-static = StaticFiles(directory="static", packages=["starlette_admin"])
+static = Mount(
+    "/static",
+    app=StaticFiles(directory="static", packages=["starlette_admin"]),
+    name="static",
+)
 
+# static files need none of the db, session or auth state, so that chain is
+# skipped as a whole for them
 middleware = [
-    Middleware(starlette_core.middleware.DatabaseMiddleware),
     Middleware(CORSMiddleware, allow_origins=settings.ALLOWED_HOSTS),
-    Middleware(SessionMiddleware, secret_key=settings.SECRET_KEY),
-    Middleware(AuthenticationMiddleware, backend=starlette_auth.ModelAuthBackend()),
+    Middleware(
+        SkipForRoute,
+        route=static,
+        middleware=[
+            (starlette_core.middleware.DatabaseMiddleware, {}),
+            (SessionMiddleware, {"secret_key": settings.SECRET_KEY}),
+            (AuthenticationMiddleware, {"backend": starlette_auth.ModelAuthBackend()}),
+        ],
+    ),
 ]
 
 routes = [
     Route("/", endpoints.Home, methods=["GET"], name="home"),
-    Mount("/admin", app=admin.adminsite, name=admin.adminsite.name),
     Mount("/auth", app=starlette_auth.app, name="auth"),
-    Mount("/static", app=static, name="static"),
+    static,
 ]
 
+if settings.ADMIN_ENABLED:
+    from app import admin
+
+    routes.append(Mount("/admin", app=admin.adminsite, name=admin.adminsite.name))
+
 app = Starlette(debug=settings.DEBUG, middleware=middleware, routes=routes)  # type: ignore
 
 app.add_exception_handler(404, handlers.not_found)
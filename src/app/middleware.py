@@ -0,0 +1,24 @@
+from starlette.routing import Match
+
+
+class SkipForRoute:
+    """
+    Builds the ``middleware`` chain once, as ``(class, options)`` pairs listed
+    outermost first. Requests matched by ``route`` bypass the whole chain and
+    go straight to the next layer.
+    """
+
+    def __init__(self, app, route, middleware):
+        self.app = app
+        self.route = route
+        self.stack = app
+        for cls, options in reversed(middleware):
+            self.stack = cls(self.stack, **options)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            match, _ = self.route.matches(scope)
+            if match == Match.FULL:
+                await self.app(scope, receive, send)
+                return
+        await self.stack(scope, receive, send)
@@ -18,6 +18,7 @@ AWS_REGION = config("AWS_REGION", default=None)
 
 # env
 TESTING = config("TESTING", cast=bool, default=False)
+ADMIN_ENABLED = config("ADMIN_ENABLED", cast=bool, default=True)
 SENTRY_DSN = config("SENTRY_DSN", cast=URL, default=None)
 
 # test
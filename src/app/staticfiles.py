@@ -0,0 +1,12 @@
+from starlette.exceptions import HTTPException
+from starlette.responses import PlainTextResponse
+from starlette.staticfiles import StaticFiles as BaseStaticFiles
+
+
+class StaticFiles(BaseStaticFiles):
+    # static requests skip auth, so errors can't use the html handlers
+    async def get_response(self, path, scope):
+        try:
+            return await super().get_response(path, scope)
+        except HTTPException as exc:
+            return PlainTextResponse(exc.detail, status_code=exc.status_code)
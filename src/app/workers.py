@@ -0,0 +1,6 @@
+from uvicorn.workers import UvicornWorker as BaseUvicornWorker
+
+
+class UvicornWorker(BaseUvicornWorker):
+    # fail on startup rather than silently falling back to asyncio/h11
+    CONFIG_KWARGS = {"loop": "uvloop", "http": "httptools"}
@@ -0,0 +1,6 @@
+import multiprocessing
+import os
+
+bind = os.environ.get("BIND", "0.0.0.0:80")
+workers = int(os.environ.get("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+worker_class = "app.workers.UvicornWorker"
@@ -0,0 +1,42 @@
+import importlib
+import sys
+
+import pytest
+from starlette.testclient import TestClient
+
+import app as app_package
+from app import auth, main, settings
+
+
+@pytest.fixture(scope="function", autouse=False)
+def admin_disabled_app(monkeypatch):
+    monkeypatch.setattr(settings, "ADMIN_ENABLED", False)
+    # forget the admin modules so a stray import would show up again
+    monkeypatch.delitem(sys.modules, "app.admin", raising=False)
+    monkeypatch.delitem(sys.modules, "app.auth.admin", raising=False)
+    monkeypatch.delattr(app_package, "admin", raising=False)
+    monkeypatch.delattr(auth, "admin", raising=False)
+    yield importlib.reload(main).app
+    monkeypatch.undo()
+    importlib.reload(main)
+
+
+def test_admin_not_imported_when_disabled(admin_disabled_app):
+    assert "app.admin" not in sys.modules
+    assert "app.auth.admin" not in sys.modules
+
+
+def test_pages_render_with_admin_disabled(admin_disabled_app):
+    with TestClient(admin_disabled_app) as client:
+        response = client.get("/")
+        assert response.status_code == 200
+        assert response.template.name == "home.html"
+        assert "Admin Site" not in response.text
+
+        # the container renders the starlette_admin login template
+        response = client.get("/auth/login")
+        assert response.status_code == 200
+        assert response.template.name == "starlette_admin/auth/login.html"
+
+        response = client.get("/admin")
+        assert response.status_code == 404
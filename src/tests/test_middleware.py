@@ -0,0 +1,43 @@
+from starlette.responses import PlainTextResponse
+from starlette.testclient import TestClient
+
+from app import main
+
+
+def test_static_skips_db_session_and_auth(monkeypatch):
+    seen = {}
+
+    async def static_app(scope, receive, send):
+        seen.update(scope)
+        await PlainTextResponse("ok")(scope, receive, send)
+
+    monkeypatch.setattr(main.static, "app", static_app)
+
+    with TestClient(main.app) as client:
+        response = client.get("/static/css/karma.min.css")
+    assert response.status_code == 200
+    assert seen["type"] == "http"
+    assert "session" not in seen
+    assert "user" not in seen
+
+
+def test_static_keeps_cors(client):
+    response = client.get(
+        "/static/css/karma.min.css", headers={"Origin": "http://other"}
+    )
+    assert response.status_code == 200
+    assert "access-control-allow-origin" in response.headers
+
+
+def test_static_file_not_found_is_plain(client):
+    response = client.get("/static/css/missing.css")
+    assert response.status_code == 404
+    assert response.text == "Not Found"
+    assert not hasattr(response, "template")
+
+
+def test_non_static_path_uses_session_and_auth(client):
+    response = client.get("/")
+    assert response.status_code == 200
+    assert "session" in response.context["request"].scope
+    assert "user" in response.context["request"].scope